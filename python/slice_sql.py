@@ -9,12 +9,13 @@ Usage example:
 """
 
 import argparse
-import math
 import datetime
+import functools
+import itertools
 import time
 import sys
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Iterable, List, Sequence, Tuple, Optional
 
 import numpy as np
@@ -30,6 +31,34 @@ except ImportError:  # pragma: no cover
     cx_Oracle = None
 
 
+# ---------- Cursor helpers ----------
+
+FETCH_ARRAYSIZE = 1000
+PG_ITERSIZE = 2000
+
+
+def tuned_cursor(conn, dbtype: str, expected_rows: int = 0):
+    """Open a cursor sized for batched fetches.
+
+    - Oracle: raise ``arraysize`` and ``prefetchrows`` so rows arrive in large
+      OCI batches instead of the driver default of 100.
+    - PG: for result sets of at least ``PG_ITERSIZE`` rows use a named
+      (server-side) cursor streamed ``itersize`` rows at a time. Named cursors
+      execute a single statement and need a transaction, so small or
+      autocommit fetches keep the regular client-side cursor.
+    """
+    if dbtype == "ora":
+        cur = conn.cursor()
+        cur.arraysize = max(expected_rows, FETCH_ARRAYSIZE)
+        cur.prefetchrows = cur.arraysize + 1
+        return cur
+    if expected_rows >= PG_ITERSIZE and not conn.autocommit:
+        cur = conn.cursor(name="slice_cur")
+        cur.itersize = PG_ITERSIZE
+        return cur
+    return conn.cursor()
+
+
 # ---------- DB metadata helpers ----------
 
 def get_pk_columns_pg(conn, table: "TableSpec", logger: Optional[logging.Logger] = None) -> List[str]:
@@ -88,43 +117,40 @@ def get_pk_columns_ora(conn, table: "TableSpec", logger: Optional[logging.Logger
 def fetch_pk_boundaries(conn, table: "TableSpec", pk_cols: Sequence[str], k: int, dbtype: str, logger: Optional[logging.Logger] = None) -> List[Tuple[Any, ...]]:
     """Fetch only boundary rows using ROW_NUMBER to avoid full PK materialization.
 
+    One round trip: an uncorrelated scalar subquery counts the rows and the
+    ROW_NUMBER window numbers them in PK order, so the table is still scanned
+    twice, as before; only every ``step``-th row and the last row are returned.
+
     Returns an ordered list of boundary tuples of length m = number of unique boundaries (>=2).
     """
     col_list = ", ".join(pk_cols)
     order_by = ", ".join(pk_cols)
-    with conn.cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) FROM {table.qualified}")
-        total = cur.fetchone()[0]
-        if total == 0:
-            return []
-        step = max(1, math.ceil(total / k))
-        rns = list({1 + i * step for i in range(k)} | {total})
-        rns.sort()
-        if logger:
-            logger.debug("count=%s step=%s rns=%s", total, step, rns)
-
+    with tuned_cursor(conn, dbtype, expected_rows=k + 1) as cur:
         if dbtype == "ora":
-            placeholders = ",".join(f":{i+1}" for i in range(len(rns)))
             sql = (
                 f"SELECT {col_list} FROM ("
-                f" SELECT {col_list}, ROW_NUMBER() OVER (ORDER BY {order_by}) rn FROM {table.qualified}"
-                f" ) WHERE rn IN ({placeholders}) ORDER BY rn"
+                f" SELECT {col_list}, ROW_NUMBER() OVER (ORDER BY {order_by}) pk_slice_rn,"
+                f" (SELECT COUNT(*) FROM {table.qualified}) pk_slice_n FROM {table.qualified}"
+                f" ) pk_slice_win"
+                f" WHERE pk_slice_rn = pk_slice_n OR MOD(pk_slice_rn - 1, GREATEST(1, CEIL(pk_slice_n / :k))) = 0"
+                f" ORDER BY pk_slice_rn"
             )
             if logger:
                 logger.debug("boundary SQL (ora) %s", sql)
-            cur.arraysize = len(rns)
-            cur.execute(sql, rns)
+            cur.execute(sql, k=k)
             rows = cur.fetchall()
         else:  # pg
-            placeholders = ",".join(["%s"] * len(rns))
             sql = (
                 f"SELECT {col_list} FROM ("
-                f" SELECT {col_list}, ROW_NUMBER() OVER (ORDER BY {order_by}) rn FROM {table.qualified}"
-                f" ) t WHERE rn IN ({placeholders}) ORDER BY rn"
+                f" SELECT {col_list}, ROW_NUMBER() OVER (ORDER BY {order_by}) AS pk_slice_rn,"
+                f" (SELECT count(*) FROM {table.qualified}) AS pk_slice_n FROM {table.qualified}"
+                f" ) pk_slice_win"
+                f" WHERE pk_slice_rn = pk_slice_n OR MOD(pk_slice_rn - 1, GREATEST(1, (pk_slice_n + %(k)s - 1) / %(k)s)) = 0"
+                f" ORDER BY pk_slice_rn"
             )
             if logger:
                 logger.debug("boundary SQL (pg) %s", sql)
-            cur.execute(sql, tuple(rns))
+            cur.execute(sql, {"k": k})
             rows = cur.fetchall()
 
     out = [tuple(r) for r in rows]
@@ -135,14 +161,20 @@ def fetch_pk_boundaries(conn, table: "TableSpec", pk_cols: Sequence[str], k: int
 
 # ---------- Formatting helpers ----------
 
+_QUOTE_TRANS = str.maketrans({"'": "''"})
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
 def fmt_literal(v: Any) -> str:
     """Format literals for Oracle/PG with ANSI syntax.
 
     - datetime with non-zero time -> TIMESTAMP literal
     - date or midnight datetime   -> DATE literal
+
+    Results are memoized since the same boundary values recur across segments.
     """
     if isinstance(v, str):
-        return "'" + v.replace("'", "''") + "'"
+        return "'" + v.translate(_QUOTE_TRANS) + "'"
     if isinstance(v, datetime.datetime):
         if v.time() == datetime.time(0, 0, 0):
             return f"DATE '{v:%Y-%m-%d}'"
@@ -158,104 +190,161 @@ def fmt_literal(v: Any) -> str:
 
 def make_single_pk_slices_from_bounds(col: str, bounds: List[Any]) -> List[str]:
     """Build single-column ranges from ordered boundary values."""
-    dedup: List[Any] = []
-    for b in bounds:
-        if not dedup or b != dedup[-1]:
-            dedup.append(b)
+    dedup: List[Any] = [b for b, _ in itertools.groupby(bounds)]
     if len(dedup) == 1:
         dedup.append(dedup[0])
 
+    fmts = [fmt_literal(b) for b in dedup]
     sqls: List[str] = []
-    for i in range(len(dedup) - 1):
-        lo, hi = dedup[i], dedup[i + 1]
-        if i == len(dedup) - 2:
-            sqls.append(f"{col} >= {fmt_literal(lo)} AND {col} <= {fmt_literal(hi)}")
+    for i in range(len(fmts) - 1):
+        lo, hi = fmts[i], fmts[i + 1]
+        if i == len(fmts) - 2:
+            sqls.append(f"{col} >= {lo} AND {col} <= {hi}")
         else:
-            sqls.append(f"{col} >= {fmt_literal(lo)} AND {col} < {fmt_literal(hi)}")
+            sqls.append(f"{col} >= {lo} AND {col} < {hi}")
     return sqls
 
 
 # ---------- Lexicographic slicing for composite PK ----------
 
+_LEXSORT_MIN_ROWS = 10_000
+
+
+def _lex_order(pk_rows: List[Tuple[Any, ...]]) -> List[int]:
+    """Return row indices of ``pk_rows`` in lexicographic order.
+
+    Large inputs are sorted column-wise with ``np.lexsort``; small ones use
+    the plain Python sort, which is cheaper than building the arrays.
+    """
+    n = len(pk_rows)
+    if n > _LEXSORT_MIN_ROWS:
+        arrs = [np.asarray([r[i] for r in pk_rows]) for i in range(len(pk_rows[0]))]
+        # lexsort treats the last key as primary
+        return np.lexsort(arrs[::-1]).tolist()
+    return sorted(range(n), key=pk_rows.__getitem__)
+
+
+def _lex_boundary_indices(pk_rows: List[Tuple[Any, ...]], k: int) -> List[int]:
+    """Return slice start row indices followed by the max row index (empty for no rows)."""
+    n = len(pk_rows)
+    if n == 0:
+        return []
+    order = _lex_order(pk_rows)
+    step = max(1, -(-n // k))
+    return order[::step] + [order[-1]]
+
+
 def chunk_lex(pk_rows: List[Tuple[Any, ...]], k: int) -> List[Tuple[Tuple[Any, ...], Tuple[Any, ...], bool]]:
     """Return half-open slice boundaries using start tuples to avoid gaps.
 
     For non-last slices: [start_i, start_{i+1})
     For last slice:      [start_last, max_tuple] (right-closed)
+
+    Only needed for a full-PK fallback that materializes every PK row; the CLI
+    and verify paths use ``fetch_pk_boundaries`` and do not call this today.
     """
-    data = sorted(pk_rows)
-    n = len(data)
-    step = max(1, math.ceil(n / k))
-    starts = [data[i] for i in range(0, n, step)]
+    idxs = _lex_boundary_indices(pk_rows, k)
+    starts = [pk_rows[i] for i in idxs[:-1]]
     slices: List[Tuple[Tuple[Any, ...], Tuple[Any, ...], bool]] = []
     for idx, lo in enumerate(starts):
         if idx + 1 < len(starts):
             hi = starts[idx + 1]
             slices.append((lo, hi, False))
         else:
-            hi = data[-1]
+            hi = pk_rows[idxs[-1]]
             slices.append((lo, hi, True))
     return slices
 
 
-def _ge_segments(cols: Sequence[str], bounds: Sequence[Any]) -> List[List[str]]:
-    """Return list of pure-AND segments representing cols >= bounds (lex)."""
-    if len(cols) == 1:
-        return [[f"{cols[0]} >= {fmt_literal(bounds[0])}"]]
-    head, tail = cols[0], cols[1:]
-    head_val = fmt_literal(bounds[0])
-    segments: List[List[str]] = []
-    # Case 1: head = bound, tail >= tail_bounds
-    for sub in _ge_segments(tail, bounds[1:]):
-        segments.append([f"{head} = {head_val}"] + sub)
-    # Case 2: head > bound (tail free)
-    segments.append([f"{head} > {head_val}"])
+def _eq_prefixes(cols: Sequence[str], fmt_vals: Sequence[str]) -> List[str]:
+    """Return ``prefixes[i]`` = "c0 = v0 AND ... c{i-1} = v{i-1} AND " for i in 0..n-1."""
+    prefixes = [""]
+    for j in range(len(cols) - 1):
+        prefixes.append(f"{prefixes[-1]}{cols[j]} = {fmt_vals[j]} AND ")
+    return prefixes
+
+
+def _ge_segments(cols: Sequence[str], fmt_vals: Sequence[str]) -> List[str]:
+    """Return pure-AND segments (already joined) representing cols >= bounds (lex).
+
+    ``fmt_vals`` holds the bounds already rendered by ``fmt_literal``.
+    Segments run from the fully fixed prefix (last column >= bound) out to
+    the first column alone (> bound).
+    """
+    prefixes = _eq_prefixes(cols, fmt_vals)
+    segments = [f"{prefixes[-1]}{cols[-1]} >= {fmt_vals[-1]}"]
+    for i in range(len(cols) - 2, -1, -1):
+        segments.append(f"{prefixes[i]}{cols[i]} > {fmt_vals[i]}")
     return segments
 
 
-def _le_segments(cols: Sequence[str], bounds: Sequence[Any], inclusive: bool) -> List[List[str]]:
-    """Return list of pure-AND segments representing cols <= bounds (lex)."""
-    if len(cols) == 1:
-        op = "<=" if inclusive else "<"
-        return [[f"{cols[0]} {op} {fmt_literal(bounds[0])}"]]
-    head, tail = cols[0], cols[1:]
-    head_val = fmt_literal(bounds[0])
-    segments: List[List[str]] = []
-    # Case 1: head < bound (tail free)
-    segments.append([f"{head} < {head_val}"])
-    # Case 2: head = bound, tail <= tail_bounds
-    for sub in _le_segments(tail, bounds[1:], inclusive):
-        segments.append([f"{head} = {head_val}"] + sub)
+def _le_segments(cols: Sequence[str], fmt_vals: Sequence[str], inclusive: bool) -> List[str]:
+    """Return pure-AND segments (already joined) representing cols <= bounds (lex).
+
+    ``fmt_vals`` holds the bounds already rendered by ``fmt_literal``.
+    Segments run from the first column alone (< bound) to the fully fixed
+    prefix (last column < or <= bound).
+    """
+    op = "<=" if inclusive else "<"
+    prefixes = _eq_prefixes(cols, fmt_vals)
+    segments = [f"{prefixes[i]}{cols[i]} < {fmt_vals[i]}" for i in range(len(cols) - 1)]
+    segments.append(f"{prefixes[-1]}{cols[-1]} {op} {fmt_vals[-1]}")
     return segments
 
 
-def build_composite_slice_wheres(cols: Sequence[str], left: Tuple[Any, ...], right: Tuple[Any, ...], is_last: bool) -> List[str]:
-    """Produce multiple pure-AND WHERE strings (no OR/UNION) covering [left, right]."""
-    if len(cols) == 1:
-        op_hi = "<=" if is_last else "<"
-        return [f"{cols[0]} >= {fmt_literal(left[0])} AND {cols[0]} {op_hi} {fmt_literal(right[0])}"]
+def build_composite_slice_wheres(
+    cols: Sequence[str],
+    left: Tuple[Any, ...],
+    right: Tuple[Any, ...],
+    is_last: bool,
+    left_fmt: Optional[Sequence[str]] = None,
+    right_fmt: Optional[Sequence[str]] = None,
+) -> List[str]:
+    """Produce multiple pure-AND WHERE strings (no OR/UNION) covering [left, right].
 
-    if left[0] == right[0]:
-        tail_wheres = build_composite_slice_wheres(cols[1:], left[1:], right[1:], is_last)
-        return [f"{cols[0]} = {fmt_literal(left[0])} AND {w}" for w in tail_wheres]
+    ``left_fmt``/``right_fmt`` may carry the bounds already rendered by
+    ``fmt_literal`` so callers that share boundaries between slices format them once.
+    """
+    if left_fmt is None:
+        left_fmt = tuple(fmt_literal(v) for v in left)
+    if right_fmt is None:
+        right_fmt = tuple(fmt_literal(v) for v in right)
+
+    n = len(cols)
+    # Columns shared by both bounds (e.g. one time bucket) become a fixed equality prefix.
+    p = 0
+    while p < n and left[p] == right[p]:
+        p += 1
+    if p == n and is_last:
+        return [" AND ".join(f"{cols[i]} = {left_fmt[i]}" for i in range(n))]
+    # A non-last slice with identical bounds is the empty range [x, x): keep the last column as a range.
+    p = min(p, n - 1)
+    common = "".join(f"{cols[i]} = {left_fmt[i]} AND " for i in range(p))
+    col, lo, hi = cols[p], left_fmt[p], right_fmt[p]
+
+    if p == n - 1:
+        op_hi = "<=" if is_last else "<"
+        return [f"{common}{col} >= {lo} AND {col} {op_hi} {hi}"]
 
     wheres: List[str] = []
 
-    # Lower band: first column fixed at left[0], tail >= left_tail
-    for seg in _ge_segments(cols[1:], left[1:]):
-        wheres.append(" AND ".join([f"{cols[0]} = {fmt_literal(left[0])}"] + seg))
+    # Lower band: first differing column fixed at its left bound, tail >= left_tail
+    prefix = f"{common}{col} = {lo} AND "
+    for seg in _ge_segments(cols[p + 1:], left_fmt[p + 1:]):
+        wheres.append(prefix + seg)
 
-    # Middle band: first column strictly between
-    wheres.append(f"{cols[0]} > {fmt_literal(left[0])} AND {cols[0]} < {fmt_literal(right[0])}")
+    # Middle band: first differing column strictly between
+    wheres.append(f"{common}{col} > {lo} AND {col} < {hi}")
 
-    # Upper band: first column fixed at right[0], tail <= right_tail (inclusive for last slice)
-    for seg in _le_segments(cols[1:], right[1:], inclusive=is_last):
-        wheres.append(" AND ".join([f"{cols[0]} = {fmt_literal(right[0])}"] + seg))
+    # Upper band: first differing column fixed at its right bound, tail <= right_tail (inclusive for last slice)
+    prefix = f"{common}{col} = {hi} AND "
+    for seg in _le_segments(cols[p + 1:], right_fmt[p + 1:], inclusive=is_last):
+        wheres.append(prefix + seg)
 
     return wheres
 
 
-def generate_slice_sql(conn, dbtype: str, table: str, k: int, profile: bool = False, logger: Optional[logging.Logger] = None) -> List[str]:
+def generate_slice_plan(conn, dbtype: str, table: str, k: int, profile: bool = False, logger: Optional[logging.Logger] = None) -> "SlicePlan":
     t0 = time.perf_counter()
     t_spec = parse_table(table)
     log = logger or logging.getLogger("slice_sql")
@@ -279,22 +368,26 @@ def generate_slice_sql(conn, dbtype: str, table: str, k: int, profile: bool = Fa
     t2 = time.perf_counter()
     log.info("pk_cols=%s boundaries=%d", pk_cols, len(boundaries))
     if not boundaries:
-        return []
+        return SlicePlan(pk_cols=pk_cols, sqls=[])
 
     sql_list: List[str] = []
 
     if len(pk_cols) == 1:
         for cond in make_single_pk_slices_from_bounds(pk_cols[0], [b[0] for b in boundaries]):
-            sql_list.append(f"SELECT * FROM {t_spec.qualified} WHERE {cond};")
+            sql_list.append(t_spec.select_prefix + cond + ";")
     else:
-        bounds = []
+        # each inner boundary closes one slice and opens the next; format it once
+        fmts = [tuple(fmt_literal(v) for v in b) for b in boundaries]
         for i in range(len(boundaries) - 1):
-            lo = boundaries[i]
-            hi = boundaries[i + 1]
-            bounds.append((lo, hi, i == len(boundaries) - 2))
-        for lo, hi, is_last in bounds:
-            for where_expr in build_composite_slice_wheres(pk_cols, lo, hi, is_last=is_last):
-                sql_list.append(f"SELECT * FROM {t_spec.qualified} WHERE {where_expr};")
+            for where_expr in build_composite_slice_wheres(
+                pk_cols,
+                boundaries[i],
+                boundaries[i + 1],
+                is_last=i == len(boundaries) - 2,
+                left_fmt=fmts[i],
+                right_fmt=fmts[i + 1],
+            ):
+                sql_list.append(t_spec.select_prefix + where_expr + ";")
 
     if logger:
         logger.info("sqls=%s", len(sql_list))
@@ -306,7 +399,11 @@ def generate_slice_sql(conn, dbtype: str, table: str, k: int, profile: bool = Fa
             file=sys.stderr,
         )
 
-    return sql_list
+    return SlicePlan(pk_cols=pk_cols, sqls=sql_list)
+
+
+def generate_slice_sql(conn, dbtype: str, table: str, k: int, profile: bool = False, logger: Optional[logging.Logger] = None) -> List[str]:
+    return generate_slice_plan(conn, dbtype, table, k, profile=profile, logger=logger).sqls
 
 
 # ---------- CLI ----------
@@ -328,6 +425,16 @@ class TableSpec:
     schema: str
     name: str
     qualified: str
+    select_prefix: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.select_prefix = f"SELECT * FROM {self.qualified} WHERE "
+
+
+@dataclass
+class SlicePlan:
+    pk_cols: List[str]
+    sqls: List[str]
 
 
 def parse_table(raw: str) -> TableSpec:
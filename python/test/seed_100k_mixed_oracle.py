@@ -1,6 +1,10 @@
 import cx_Oracle
 
+from seed_rows import BATCH_ROWS, iter_batches
+
 CONN_STR = "system/SysPassword1@192.168.163.227:1527/pdb1"
+SHAPE = (100, 10, 100)
+B_LABELS = {1: [f"L{i:02d}" for i in range(1, SHAPE[1] + 1)]}
 
 
 def main():
@@ -30,17 +34,15 @@ def main():
         """
     )
 
-    # 100 * 10 * 100 = 100,000 rows; B is character key part
-    cur.execute(
-        """
-        INSERT /*+ APPEND */ INTO T_SPLIT_MIXED (A, B, C, PAD)
-        SELECT a.lv, 'L' || LPAD(b.lv, 2, '0'), c.lv, 'x'
-        FROM (SELECT LEVEL lv FROM dual CONNECT BY LEVEL <= 100) a
-        CROSS JOIN (SELECT LEVEL lv FROM dual CONNECT BY LEVEL <= 10) b
-        CROSS JOIN (SELECT LEVEL lv FROM dual CONNECT BY LEVEL <= 100) c
-        """
-    )
-    conn.commit()
+    # 100 * 10 * 100 = 100,000 rows; B is character key part.
+    # Client-side array DML batches; each direct-path batch is committed before the next.
+    cur.bindarraysize = BATCH_ROWS
+    for rows in iter_batches(SHAPE, labels=B_LABELS):
+        cur.executemany(
+            "INSERT /*+ APPEND_VALUES */ INTO T_SPLIT_MIXED (A, B, C, PAD) VALUES (:1, :2, :3, :4)",
+            rows,
+        )
+        conn.commit()
 
     cur.close()
     conn.close()
@@ -1,6 +1,11 @@
 import psycopg2
+from psycopg2.extras import execute_values
+
+from seed_rows import iter_batches
 
 CONN_STR = "host=192.168.163.131 port=7456 user=ogadmin password=Mogdb@123 dbname=postgres"
+SHAPE = (100, 10, 100)
+B_LABELS = {1: [f"L{i:02d}" for i in range(1, SHAPE[1] + 1)]}
 
 
 def main():
@@ -21,15 +26,8 @@ def main():
         """
     )
 
-    cur.execute(
-        """
-        INSERT INTO t_split_mixed (a, b, c, pad)
-        SELECT a, 'L' || LPAD(b::text, 2, '0'), c, 'x'
-        FROM generate_series(1, 100) a
-        CROSS JOIN generate_series(1, 10) b
-        CROSS JOIN generate_series(1, 100) c
-        """
-    )
+    for rows in iter_batches(SHAPE, labels=B_LABELS):
+        execute_values(cur, "INSERT INTO t_split_mixed (a, b, c, pad) VALUES %s", rows, page_size=len(rows))
 
     cur.close()
     conn.close()
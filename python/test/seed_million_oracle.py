@@ -1,6 +1,9 @@
 import cx_Oracle
 
+from seed_rows import BATCH_ROWS, iter_batches
+
 CONN_STR = "system/SysPassword1@192.168.163.227:1527/pdb1"
+SHAPE = (100, 100, 100)
 
 def main():
     conn = cx_Oracle.connect(CONN_STR)
@@ -29,17 +32,15 @@ def main():
         """
     )
 
-    # Insert 1,000,000 rows via cartesian of 1..100 three times
-    cur.execute(
-        """
-        INSERT /*+ APPEND */ INTO T_SPLIT_MILLION (A,B,C,PAD)
-        SELECT a.lv, b.lv, c.lv, 'x'
-        FROM (SELECT LEVEL lv FROM dual CONNECT BY LEVEL <= 100) a
-        CROSS JOIN (SELECT LEVEL lv FROM dual CONNECT BY LEVEL <= 100) b
-        CROSS JOIN (SELECT LEVEL lv FROM dual CONNECT BY LEVEL <= 100) c
-        """
-    )
-    conn.commit()
+    # Insert 1,000,000 rows (1..100 three times) as client-side array DML batches;
+    # each direct-path batch must be committed before the next one touches the table
+    cur.bindarraysize = BATCH_ROWS
+    for rows in iter_batches(SHAPE):
+        cur.executemany(
+            "INSERT /*+ APPEND_VALUES */ INTO T_SPLIT_MILLION (A,B,C,PAD) VALUES (:1, :2, :3, :4)",
+            rows,
+        )
+        conn.commit()
     cur.close()
     conn.close()
     print("seeded 1,000,000 rows into T_SPLIT_MILLION")
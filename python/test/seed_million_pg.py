@@ -1,6 +1,10 @@
 import psycopg2
+from psycopg2.extras import execute_values
+
+from seed_rows import iter_batches
 
 CONN_STR = "host=192.168.163.131 port=7456 user=ogadmin password=Mogdb@123 dbname=postgres"
+SHAPE = (100, 100, 100)
 
 def main():
     conn = psycopg2.connect(CONN_STR)
@@ -19,15 +23,8 @@ def main():
         """
     )
     cur.execute("TRUNCATE t_split_million")
-    cur.execute(
-        """
-        INSERT INTO t_split_million (a,b,c,pad)
-        SELECT a, b, c, 'x'
-        FROM generate_series(1,100) a
-        CROSS JOIN generate_series(1,100) b
-        CROSS JOIN generate_series(1,100) c
-        """
-    )
+    for rows in iter_batches(SHAPE):
+        execute_values(cur, "INSERT INTO t_split_million (a,b,c,pad) VALUES %s", rows, page_size=len(rows))
     cur.close()
     conn.close()
     print("seeded 1,000,000 rows into t_split_million")
@@ -38,18 +38,19 @@ for s in stmts:
 # populate T_SPLIT_TEST: 3 days, 10 rows per day
 today = datetime.datetime.now().date()
 cur.execute("DELETE FROM T_SPLIT_TEST")
-for d in range(3):
-    dt = today - datetime.timedelta(days=d)
-    for i in range(1, 11):
-        cur.execute(
-            "INSERT INTO T_SPLIT_TEST (DT, ID, PAD) VALUES (:1, :2, :3)",
-            (dt, i, f"row-{d*100 + i}")
-        )
+rows = [
+    (today - datetime.timedelta(days=d), i, f"row-{d*100 + i}")
+    for d in range(3)
+    for i in range(1, 11)
+]
+cur.bindarraysize = len(rows)
+cur.executemany("INSERT INTO T_SPLIT_TEST (DT, ID, PAD) VALUES (:1, :2, :3)", rows)
 
 # populate T_SPLIT_SINGLE: 30 rows
 cur.execute("DELETE FROM T_SPLIT_SINGLE")
-for i in range(1, 31):
-    cur.execute("INSERT INTO T_SPLIT_SINGLE (ID, PAD) VALUES (:1, :2)", (i, f"row-{i}"))
+rows = [(i, f"row-{i}") for i in range(1, 31)]
+cur.bindarraysize = len(rows)
+cur.executemany("INSERT INTO T_SPLIT_SINGLE (ID, PAD) VALUES (:1, :2)", rows)
 
 conn.commit()
 cur.close()
@@ -0,0 +1,27 @@
+import itertools
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BATCH_ROWS = 50_000
+
+
+def iter_batches(
+    shape: Sequence[int],
+    labels: Optional[Dict[int, Sequence[str]]] = None,
+    pad: str = "x",
+    batch_rows: int = BATCH_ROWS,
+) -> Iterator[List[Tuple]]:
+    """Yield (k1, ..., kn, pad) rows of the 1..shape[i] cartesian product in key order, batch_rows at a time.
+
+    ``labels`` maps a column index to the text values that replace 1..shape[i] in that column.
+    """
+    labels = labels or {}
+    total = int(np.prod(shape))
+    for lo in range(0, total, batch_rows):
+        idx = np.unravel_index(np.arange(lo, min(lo + batch_rows, total)), shape)
+        cols = [
+            [labels[i][v] for v in col.tolist()] if i in labels else (col + 1).tolist()
+            for i, col in enumerate(idx)
+        ]
+        yield list(zip(*cols, itertools.repeat(pad)))
@@ -1,13 +1,15 @@
 import argparse
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
 import cx_Oracle
 import psycopg2
 
 from slice_sql import (
-    generate_slice_sql,
-    get_pk_columns_pg,
-    get_pk_columns_ora,
+    generate_slice_plan,
+    tuned_cursor,
 )
 
 
@@ -25,54 +27,104 @@ def wrap_count(dbtype: str, sql: str) -> str:
     return f"SELECT COUNT(*) FROM ({sql})"
 
 
-def verify_table(dbtype: str, conn_str: str, table: str, slices: int):
-    conn = connect(dbtype, conn_str)
-    cur = conn.cursor()
-    cur.execute(f"SELECT COUNT(*) FROM {table}")
-    total = cur.fetchone()[0]
+def count_slices_parallel(dbtype: str, conn_str: str, sqls: List[str], workers: int) -> List[int]:
+    """Count each slice SQL on a pool of worker threads, one DB session per thread.
 
-    sqls = [s.rstrip(";\n \t") for s in generate_slice_sql(conn, dbtype, table, slices)]
+    DB-API connections must not be shared across threads, so each worker opens
+    its own in the pool initializer; all of them are closed once the pool shuts down.
+    """
+    local = threading.local()
+    conns = []
+    lock = threading.Lock()
 
-    counts = []
-    for sql in sqls:
-        cur.execute(wrap_count(dbtype, sql))
-        counts.append(cur.fetchone()[0])
+    def open_session():
+        local.conn = connect(dbtype, conn_str)
+        with lock:
+            conns.append(local.conn)
 
-    # PK columns
-    if dbtype == "pg":
-        pk_cols = get_pk_columns_pg(conn, table)
-    else:
-        pk_cols = get_pk_columns_ora(conn, table)
-    pk_list = ",".join(pk_cols)
+    def count(sql: str) -> int:
+        cur = local.conn.cursor()
+        try:
+            cur.execute(wrap_count(dbtype, sql))
+            return cur.fetchone()[0]
+        finally:
+            cur.close()
 
-    pk_selects = [sql.replace("SELECT *", f"SELECT {pk_list}") for sql in sqls]
+    try:
+        with ThreadPoolExecutor(max_workers=workers, initializer=open_session) as pool:
+            return list(pool.map(count, sqls))
+    finally:
+        for conn in conns:
+            conn.close()
 
-    # overlap
-    if dbtype == "pg":
-        overlap_sql = "SELECT COUNT(*) FROM (" + " UNION ALL ".join(pk_selects) + f") AS t GROUP BY {pk_list} HAVING COUNT(*)>1"
-        union_sql = "SELECT COUNT(*) FROM (" + " UNION ".join(pk_selects) + ") AS t"
-    else:
-        overlap_sql = "SELECT COUNT(*) FROM (" + " UNION ALL ".join(pk_selects) + f") GROUP BY {pk_list} HAVING COUNT(*)>1"
-        union_sql = "SELECT COUNT(*) FROM (" + " UNION ".join(pk_selects) + ")"
 
-    cur.execute(overlap_sql)
-    overlap_rows = cur.fetchall()
-    overlap_cnt = sum(r[0] for r in overlap_rows) if overlap_rows else 0
+def combined_count_sql(sqls: List[str]) -> str:
+    # one result set of (slice number, row count); the bare subquery alias works on pg and ora
+    return " UNION ALL ".join(f"SELECT {i} AS sn, COUNT(*) AS c FROM ({sql}) x" for i, sql in enumerate(sqls))
 
-    cur.execute(union_sql)
-    union_cnt = cur.fetchone()[0]
 
-    cur.close()
-    conn.close()
+def verify_table(dbtype: str, conn_str: str, table: str, slices: int, workers: int = 1, verbose: bool = False):
+    conn = connect(dbtype, conn_str)
+    cur = tuned_cursor(conn, dbtype)
+    cur.execute(f"SELECT COUNT(*) FROM {table}")
+    total = cur.fetchone()[0]
+
+    plan = generate_slice_plan(conn, dbtype, table, slices)
+    sqls = [s.rstrip(";\n \t") for s in plan.sqls]
 
-    return {
+    pk_list = ",".join(plan.pk_cols)
+
+    pk_selects = [sql.replace("SELECT *", f"SELECT {pk_list}") for sql in sqls]
+    union_body = " UNION ".join(pk_selects)
+
+    counts = [0] * len(sqls)
+    union_cnt = 0
+    overlap_extra = None
+    if sqls and workers > 1:
+        # Slices cover disjoint PK ranges, so their counts can run concurrently,
+        # one session per worker. Keep workers <= max_connections / 2 on the target DB.
+        counts = count_slices_parallel(dbtype, conn_str, sqls, min(workers, len(sqls)))
+        cur.execute(f"SELECT COUNT(*) FROM ({union_body}) x")
+        union_cnt = cur.fetchone()[0]
+    elif sqls:
+        # slice counts and the distinct union count in one statement, i.e. one snapshot,
+        # so their difference stays meaningful under concurrent DML
+        cur.execute(combined_count_sql(sqls) + f" UNION ALL SELECT -1 AS sn, COUNT(*) AS c FROM ({union_body}) x")
+        for sn, c in cur.fetchall():
+            if sn < 0:
+                union_cnt = c
+            else:
+                counts[sn] = c
+        # extra copies: every PK counted by more than one slice inflates the per-slice sum over the distinct union
+        overlap_extra = sum(counts) - union_cnt
+
+    res = {
         "table": table,
         "total": total,
         "slice_counts": counts,
         "sum_slices": sum(counts),
         "union_cnt": union_cnt,
-        "overlap_cnt": overlap_cnt,
     }
+    if overlap_extra is not None:
+        # only reported when counts and union come from the same statement;
+        # parallel counts run on other sessions/snapshots, so sum - union is not an overlap check there
+        res["overlap_extra"] = overlap_extra
+
+    if verbose:
+        # detailed check: hashes/sorts every PK server-side, so only on request;
+        # overlap_cnt is the total size of all duplicated PK groups
+        if dbtype == "pg":
+            overlap_sql = "SELECT COUNT(*) FROM (" + " UNION ALL ".join(pk_selects) + f") AS t GROUP BY {pk_list} HAVING COUNT(*)>1"
+        else:
+            overlap_sql = "SELECT COUNT(*) FROM (" + " UNION ALL ".join(pk_selects) + f") GROUP BY {pk_list} HAVING COUNT(*)>1"
+        cur.execute(overlap_sql)
+        overlap_rows = cur.fetchall()
+        res["overlap_cnt"] = sum(r[0] for r in overlap_rows) if overlap_rows else 0
+
+    cur.close()
+    conn.close()
+
+    return res
 
 
 def main():
@@ -81,9 +133,11 @@ def main():
     ap.add_argument("--conn", required=True)
     ap.add_argument("--table", required=True)
     ap.add_argument("--slices", type=int, default=4)
+    ap.add_argument("--workers", type=int, default=1, help="Slice count sessions; 1 (default) = single UNION ALL query, >1 = opt-in parallel counts (no overlap_extra, since counts then come from other snapshots)")
+    ap.add_argument("--verbose", action="store_true", help="Also run the full GROUP BY overlap query (adds overlap_cnt)")
     args = ap.parse_args()
 
-    res = verify_table(args.dbtype, args.conn, args.table, args.slices)
+    res = verify_table(args.dbtype, args.conn, args.table, args.slices, workers=args.workers, verbose=args.verbose)
     print(res)
 
 